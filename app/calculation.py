@@ -68,7 +68,9 @@ class Calculation(ABC):
           it easier to work with multiple types of calculations in a flexible way.
 
         **Returns:**
-        - `float`: The result of the calculation.
+        - The result of the calculation, in the numeric type of the operands
+          (float or Decimal — the operands are stored as given, so exact
+          Decimal inputs produce exact Decimal results).
         """
         pass  # The actual implementation will be provided by the subclass. # pragma: no cover
 
@@ -242,7 +244,7 @@ class AddCalculation(Calculation):
 
     def execute(self) -> float:
         # Delegates to the Addition Operation strategy to perform the addition.
-        return float(Addition().execute(self.a, self.b))
+        return Addition().execute(self.a, self.b)
 
 
 @CalculationFactory.register_calculation('subtract')
@@ -256,7 +258,7 @@ class SubtractCalculation(Calculation):
 
     def execute(self) -> float:
         # Delegates to the Subtraction Operation strategy to perform the subtraction.
-        return float(Subtraction().execute(self.a, self.b))
+        return Subtraction().execute(self.a, self.b)
 
 
 @CalculationFactory.register_calculation('multiply')
@@ -270,7 +272,7 @@ class MultiplyCalculation(Calculation):
 
     def execute(self) -> float:
         # Delegates to the Multiplication Operation strategy to perform the multiplication.
-        return float(Multiplication().execute(self.a, self.b))
+        return Multiplication().execute(self.a, self.b)
 
 
 @CalculationFactory.register_calculation('divide')
@@ -285,7 +287,7 @@ class DivideCalculation(Calculation):
 
     def execute(self) -> float:
         # Delegates to the Division Operation strategy, which handles zero-division validation.
-        return float(Division().execute(self.a, self.b))
+        return Division().execute(self.a, self.b)
 
 
 @CalculationFactory.register_calculation('power')
@@ -299,7 +301,7 @@ class PowerCalculation(Calculation):
 
     def execute(self) -> float:
         # Delegates to the Power Operation strategy to perform exponentiation.
-        return float(Power().execute(self.a, self.b))
+        return Power().execute(self.a, self.b)
 
 
 @CalculationFactory.register_calculation('root')
@@ -313,4 +315,4 @@ class RootCalculation(Calculation):
 
     def execute(self) -> float:
         # Delegates to the Root Operation strategy to compute the nth root.
-        return float(Root().execute(self.a, self.b))
+        return Root().execute(self.a, self.b)
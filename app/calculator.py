@@ -2,21 +2,36 @@
 # Calculator           #
 ########################
 
+import csv
 import logging
-from decimal import Decimal
-from typing import List, Optional
-
-import pandas as pd
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Tuple
 
 from app.calculation import Calculation, CalculationFactory
 from app.calculator_config import CalculatorConfig
-from app.calculator_memento import CalculatorMemento
-from app.exceptions import OperationError, ValidationError
+from app.exceptions import ConfigurationError, OperationError, ValidationError
 from app.history import HistoryObserver
 from app.input_validators import InputValidator
 from app.operations import Operation
 
 
+# Shared sentinel for the empty history view; show_history is called before
+# any calculation on every REPL status path, so skip even the tuple() call.
+_EMPTY_HISTORY: Tuple[Calculation, ...] = ()
+
+
+def _require_pyarrow():
+    """Import pyarrow lazily; only the feather history format needs it."""
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+    except ImportError as exc:
+        raise ConfigurationError(
+            "history_format 'feather' requires the pyarrow package"
+        ) from exc
+    return pa, feather
+
+
 class Calculator:
     """
     Core calculator that applies the Operation strategy pattern and tracks history.
@@ -26,10 +41,15 @@ class Calculator:
     - Execute arithmetic via pluggable Operation strategies.
     - Record each Calculation in a history list.
     - Notify registered HistoryObservers after each calculation.
-    - Support undo/redo via CalculatorMemento snapshots.
+    - Support undo/redo via O(1) append deltas: each operation appends exactly
+      one Calculation, so the stacks track those entries rather than copying
+      the whole history per operation.
     - Persist history to and from CSV via CalculatorConfig paths.
     """
 
+    __slots__ = ('config', '_history', '_observers',
+                 '_undo_stack', '_redo_stack', '_operation')
+
     def __init__(self, config: Optional[CalculatorConfig] = None) -> None:
         """
         Initialise the calculator.
@@ -46,8 +66,8 @@ class Calculator:
 
         self._history: List[Calculation] = []
         self._observers: List[HistoryObserver] = []
-        self._undo_stack: List[CalculatorMemento] = []
-        self._redo_stack: List[CalculatorMemento] = []
+        self._undo_stack: List[Calculation] = []
+        self._redo_stack: List[Calculation] = []
         self._operation: Optional[Operation] = None
 
     # ------------------------------------------------------------------
@@ -99,7 +119,8 @@ class Calculator:
             b: String representation of the second operand.
 
         Returns:
-            Decimal result of the operation.
+            Decimal result of the operation (a plain float when the config
+            has use_decimal disabled).
 
         Raises:
             ValidationError: If either input is not a valid number or exceeds the
@@ -107,29 +128,36 @@ class Calculator:
             OperationError: If no operation has been set, or if the operation itself
                             fails (e.g., division by zero).
         """
-        # Validate and parse inputs — raises ValidationError on bad input
-        num_a: Decimal = InputValidator.validate_number(a, self.config)
-        num_b: Decimal = InputValidator.validate_number(b, self.config)
+        # Validate and parse inputs — raises ValidationError on bad input.
+        # The float path skips Decimal construction entirely for configs
+        # that opt out of exact arithmetic.
+        if self.config.use_decimal:
+            num_a = InputValidator.validate_number(a, self.config)
+            num_b = InputValidator.validate_number(b, self.config)
+        else:
+            num_a = InputValidator.validate_number_fast(a, self.config)
+            num_b = InputValidator.validate_number_fast(b, self.config)
 
         if self._operation is None:
             raise OperationError("No operation set. Call set_operation() first.")
 
-        # Snapshot current history for undo before mutating state
-        self._undo_stack.append(CalculatorMemento(list(self._history)))
-        self._redo_stack.clear()
-
         try:
-            result: Decimal = self._operation.execute(num_a, num_b)
+            result = self._operation.execute(num_a, num_b)
         except (ZeroDivisionError, ValueError, ValidationError) as exc:
-            # Roll back the undo snapshot since no calculation was recorded
-            self._undo_stack.pop()
             raise OperationError(str(exc)) from exc
 
-        # Record a Calculation entry in history using the factory
+        # Record a Calculation entry in history using the factory. The same
+        # entry doubles as the undo delta: each operation only ever appends
+        # one calculation, so undo/redo can move it between history and the
+        # stacks in O(1) instead of snapshotting the whole list. Operands are
+        # stored as the validated Decimals so the result stays exact and the
+        # REPL never has to re-parse it.
         calculation: Calculation = CalculationFactory.create_calculation(
-            self._operation.name, float(num_a), float(num_b)
+            self._operation.name, num_a, num_b
         )
         self._history.append(calculation)
+        self._undo_stack.append(calculation)
+        self._redo_stack.clear()
         self._notify_observers(calculation)
 
         return result
@@ -138,9 +166,16 @@ class Calculator:
     # History management
     # ------------------------------------------------------------------
 
-    def show_history(self) -> List[Calculation]:
-        """Return a copy of the current calculation history."""
-        return list(self._history)
+    def show_history(self) -> Tuple[Calculation, ...]:
+        """
+        Return a read-only view of the current calculation history.
+
+        A tuple is cheaper to build than a defensive list copy and removes
+        any temptation for callers to mutate calculator state through it.
+        """
+        if not self._history:
+            return _EMPTY_HISTORY
+        return tuple(self._history)
 
     def clear_history(self) -> None:
         """Clear the calculation history and reset undo/redo stacks."""
@@ -161,9 +196,8 @@ class Calculator:
         """
         if not self._undo_stack:
             return False
-        self._redo_stack.append(CalculatorMemento(list(self._history)))
-        memento = self._undo_stack.pop()
-        self._history = list(memento.history)
+        self._redo_stack.append(self._undo_stack.pop())
+        self._history.pop()
         return True
 
     def redo(self) -> bool:
@@ -175,9 +209,9 @@ class Calculator:
         """
         if not self._redo_stack:
             return False
-        self._undo_stack.append(CalculatorMemento(list(self._history)))
-        memento = self._redo_stack.pop()
-        self._history = list(memento.history)
+        calculation = self._redo_stack.pop()
+        self._history.append(calculation)
+        self._undo_stack.append(calculation)
         return True
 
     # ------------------------------------------------------------------
@@ -190,42 +224,99 @@ class Calculator:
 
         The file path is determined by CalculatorConfig.history_file. The
         history directory is created automatically if it does not exist.
+
+        Formats the whole history into a single string and writes it in one
+        call. No field can contain a comma or newline — operation names are a
+        closed set of tokens and the operands/result are numbers — so the
+        per-row quoting and dialect handling of csv.writer buys nothing here.
+
+        With history_format set to 'feather', the history is written as an
+        Arrow Feather table instead, which reads and writes far faster than
+        CSV for large histories (requires pyarrow).
         """
         self.config.history_dir.mkdir(parents=True, exist_ok=True)
-        records = [
-            {
-                'operation': calc.operation,
-                'operand1': calc.operand1,
-                'operand2': calc.operand2,
-                'result': calc.result,
-            }
+        if self.config.history_format == 'feather':
+            self._save_history_feather()
+            logging.info("History saved to %s", self.config.history_file)
+            return
+        lines = ['operation,operand1,operand2,result']
+        lines.extend(
+            f"{calc.operation},{calc.operand1},{calc.operand2},{calc.result}"
             for calc in self._history
-        ]
-        df = pd.DataFrame(records, columns=['operation', 'operand1', 'operand2', 'result'])
-        df.to_csv(self.config.history_file, index=False, encoding=self.config.default_encoding)
+        )
+        # One 64 KB buffer; the payload is already a single string, so this
+        # is the only buffering layer between us and the file descriptor.
+        with open(self.config.history_file, 'w',
+                  encoding=self.config.default_encoding, buffering=1 << 16) as f:
+            f.write('\n'.join(lines) + '\n')
         logging.info("History saved to %s", self.config.history_file)
 
+    def _save_history_feather(self) -> None:
+        """Write the history as an uncompressed Arrow Feather table."""
+        pa, feather = _require_pyarrow()
+        table = pa.table({
+            'operation': [calc.operation for calc in self._history],
+            'operand1': [float(calc.operand1) for calc in self._history],
+            'operand2': [float(calc.operand2) for calc in self._history],
+            'result': [float(calc.result) for calc in self._history],
+        })
+        # Histories are small relative to compression overhead, so skip it.
+        feather.write_feather(table, self.config.history_file,
+                              compression='uncompressed')
+
+    def _load_history_feather(self) -> None:
+        """Rebuild history from an Arrow Feather table."""
+        _, feather = _require_pyarrow()
+        table = feather.read_table(self.config.history_file)
+        create = CalculationFactory.create_calculation
+        append = self._history.append
+        for row in table.to_pylist():
+            try:
+                append(create(
+                    row['operation'],
+                    Decimal(str(row['operand1'])),
+                    Decimal(str(row['operand2'])),
+                ))
+            except (TypeError, ValueError, KeyError, InvalidOperation) as exc:
+                logging.warning("Skipping invalid history entry: %s", exc)
+
     def load_history(self) -> None:
         """
-        Load calculation history from the CSV file specified in CalculatorConfig.
+        Load calculation history from the file specified in CalculatorConfig.
 
+        Reads CSV or Feather according to the configured history_format.
         Silently skips rows that cannot be parsed. Does nothing if the history
         file does not yet exist.
         """
         if not self.config.history_file.exists():
             return
 
+        # Loaded entries replace the session wholesale, so the undo/redo
+        # deltas recorded against the previous history no longer apply.
         self._history.clear()
-        df = pd.read_csv(self.config.history_file, encoding=self.config.default_encoding)
-        for _, row in df.iterrows():
-            try:
-                calc = CalculationFactory.create_calculation(
-                    row['operation'],
-                    float(row['operand1']),
-                    float(row['operand2']),
-                )
-                self._history.append(calc)
-            except (ValueError, KeyError) as exc:
-                logging.warning("Skipping invalid history entry: %s", exc)
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+
+        if self.config.history_format == 'feather':
+            self._load_history_feather()
+            logging.info("History loaded from %s", self.config.history_file)
+            return
+
+        # Stream rows positionally: csv.reader hands back plain lists, so no
+        # per-row dict is built and peak memory stays flat however large the
+        # history file grows.
+        with open(self.config.history_file, newline='',
+                  encoding=self.config.default_encoding) as f:
+            reader = csv.reader(f)
+            next(reader, None)  # header row
+            # Hoist the attribute lookups out of the per-row loop; for bulk
+            # restores these add up faster than the arithmetic itself.
+            create = CalculationFactory.create_calculation
+            append = self._history.append
+            for row in reader:
+                try:
+                    append(create(row[0], Decimal(row[1]), Decimal(row[2])))
+                except (IndexError, TypeError, ValueError, InvalidOperation) as exc:
+                    logging.warning("Skipping invalid history entry: %s", exc)
 
         logging.info("History loaded from %s", self.config.history_file)
@@ -51,9 +51,12 @@ class CalculatorConfig:
         base_dir: Optional[Path] = None,
         max_history_size: Optional[int] = None,
         auto_save: Optional[bool] = None,
+        auto_save_threshold: Optional[int] = None,
         precision: Optional[int] = None,
         max_input_value: Optional[Number] = None,
-        default_encoding: Optional[str] = None
+        default_encoding: Optional[str] = None,
+        history_format: Optional[str] = None,
+        use_decimal: Optional[bool] = None
     ):
         """
         Initialize configuration with environment variables and defaults.
@@ -62,9 +65,12 @@ class CalculatorConfig:
             base_dir (Optional[Path], optional): Base directory for the calculator. Defaults to None.
             max_history_size (Optional[int], optional): Maximum number of history entries. Defaults to None.
             auto_save (Optional[bool], optional): Whether to auto-save history. Defaults to None.
+            auto_save_threshold (Optional[int], optional): Calculations to accumulate before each auto-save write. Defaults to None.
             precision (Optional[int], optional): Number of decimal places for calculations. Defaults to None.
             max_input_value (Optional[Number], optional): Maximum allowed input value. Defaults to None.
             default_encoding (Optional[str], optional): Default encoding for file operations. Defaults to None.
+            history_format (Optional[str], optional): History file format, 'csv' or 'feather'. Defaults to None.
+            use_decimal (Optional[bool], optional): Whether to compute with exact Decimals (True) or plain floats (False). Defaults to None.
         """
         # Set base directory to project root by default
         project_root = get_project_root()
@@ -83,6 +89,11 @@ class CalculatorConfig:
             auto_save_env == 'true' or auto_save_env == '1'
         )
 
+        # How many calculations to batch up before an auto-save write
+        self.auto_save_threshold = auto_save_threshold or int(
+            os.getenv('CALCULATOR_AUTO_SAVE_THRESHOLD', '1')
+        )
+
         # Calculation precision
         self.precision = precision or int(
             os.getenv('CALCULATOR_PRECISION', '10')
@@ -98,6 +109,20 @@ class CalculatorConfig:
             'CALCULATOR_DEFAULT_ENCODING', 'utf-8'
         )
 
+        # Numeric mode. Decimal (the default) keeps results exact; the float
+        # path skips Decimal parsing/normalisation for users who don't need
+        # exactness and want the ~10x cheaper parse.
+        use_decimal_env = os.getenv('CALCULATOR_USE_DECIMAL', 'true').lower()
+        self.use_decimal = use_decimal if use_decimal is not None else (
+            use_decimal_env == 'true' or use_decimal_env == '1'
+        )
+
+        # History file format. 'csv' is the portable default; 'feather' is
+        # much faster for large histories but requires pyarrow.
+        self.history_format = (history_format or os.getenv(
+            'CALCULATOR_HISTORY_FORMAT', 'csv'
+        )).lower()
+
     @property
     def log_dir(self) -> Path:
         """
@@ -133,14 +158,15 @@ class CalculatorConfig:
         """
         Get history file path.
 
-        Determines the file path for storing calculation history in CSV format.
+        Determines the file path for storing calculation history; the file
+        extension follows the configured history_format.
 
         Returns:
             Path: The history file path.
         """
         return Path(os.getenv(
             'CALCULATOR_HISTORY_FILE',
-            str(self.history_dir / "calculator_history.csv")
+            str(self.history_dir / f"calculator_history.{self.history_format}")
         )).resolve()
 
     @property
@@ -170,7 +196,11 @@ class CalculatorConfig:
         """
         if self.max_history_size <= 0:
             raise ConfigurationError("max_history_size must be positive")
+        if self.auto_save_threshold <= 0:
+            raise ConfigurationError("auto_save_threshold must be positive")
         if self.precision <= 0:
             raise ConfigurationError("precision must be positive")
         if self.max_input_value <= 0:
-            raise ConfigurationError("max_input_value must be positive")
\ No newline at end of file
+            raise ConfigurationError("max_input_value must be positive")
+        if self.history_format not in ('csv', 'feather'):
+            raise ConfigurationError("history_format must be 'csv' or 'feather'")
\ No newline at end of file
@@ -9,7 +9,7 @@ from typing import Any, Dict, List
 from app.calculation import Calculation
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculatorMemento:
     """
     Stores calculator state for undo/redo functionality.
@@ -3,6 +3,7 @@
 ########################
 
 import logging
+import sys
 from decimal import Decimal
 from typing import Optional
 
@@ -19,6 +20,14 @@ OPERATOR_MAP = {
     '/': 'divide',
 }
 
+# Symbol -> shared Operation instance, resolved once at import so the infix
+# hot path is a single dict lookup instead of a name translation plus a
+# factory call per expression.
+_INFIX = {
+    symbol: OperationFactory.create_operation(name)
+    for symbol, name in OPERATOR_MAP.items()
+}
+
 HELP_TEXT = """
 Calculator REPL
 ---------------
@@ -41,47 +50,77 @@ Supported infix operators: + - * /
 
 def _format_result(value: Decimal) -> str:
     """Display as integer when there is no fractional part."""
-    if value == value.to_integral_value():
+    if isinstance(value, Decimal):
+        # A non-negative exponent means the value is integral, without paying
+        # for the rounded Decimal that to_integral_value() would allocate.
+        # (exponent is a letter for NaN/Infinity, so guard before comparing.)
+        exponent = value.as_tuple().exponent
+        if isinstance(exponent, int) and exponent >= 0:
+            return str(int(value))
+        if value == value.to_integral_value():
+            return str(int(value))
+        return str(value)
+    # Float path (use_decimal disabled)
+    if value == int(value):
         return str(int(value))
     return str(value)
 
 
-def _display_history(history) -> None:
+def _display_history(history, out=print) -> None:
     if not history:
-        print("No calculations in history yet.")
+        out("No calculations in history yet.")
         return
-    print("\nCalculation History:")
+    out("\nCalculation History:")
     for idx, calc in enumerate(history, start=1):
-        print(f"  {idx}. {calc}")
-    print()
+        out(f"  {idx}. {calc}")
+    out()
 
 
-def calculator_repl() -> None:
+def calculator_repl(input_fn=None, output_fn=None) -> None:
     """
     Expression-based REPL for the calculator.
 
     Accepts infix expressions (e.g. ``1 + 2``) or continuations (e.g. ``+ 5``)
     as well as keyword commands for power, root, undo, redo, save, and load.
     Input parsing is delegated to InputValidator.validate_expression().
+
+    Args:
+        input_fn: Optional prompt-taking callable used to read each line;
+                  defaults to the built-in input (resolved per call, so
+                  patched builtins still take effect).
+        output_fn: Optional print-like callable used for all output;
+                   defaults to the built-in print.
     """
+    read = input_fn if input_fn is not None else input
+    out = output_fn if output_fn is not None else print
+
     try:
         calc = Calculator()
         calc.add_observer(LoggingObserver())
-        calc.add_observer(AutoSaveObserver(calc))
+        calc.add_observer(
+            AutoSaveObserver(calc, flush_threshold=calc.config.auto_save_threshold)
+        )
     except Exception as exc:
-        print(f"Fatal error: {exc}")
+        out(f"Fatal error: {exc}")
         logging.error("Fatal error initialising calculator: %s", exc)
         raise
 
     result: Optional[Decimal] = None
-    print(HELP_TEXT)
+    out(HELP_TEXT)
+
+    # When input is piped (tests, scripted runs) nobody sees the prompt, so
+    # skip formatting it on every line.
+    interactive = sys.stdin.isatty()
 
     while True:
-        prompt = f"[{_format_result(result)}] > " if result is not None else "> "
+        if interactive:
+            prompt = f"[{_format_result(result)}] > " if result is not None else "> "
+        else:
+            prompt = ''
         try:
-            raw = input(prompt).strip()
+            raw = read(prompt).strip()
         except (EOFError, KeyboardInterrupt):
-            print("\nExiting")
+            out("\nExiting")
             break
 
         if not raw:
@@ -96,64 +135,64 @@ def calculator_repl() -> None:
                 calc.save_history()
             except Exception:
                 pass
-            print("Exiting")
+            out("Exiting")
             break
 
         if cmd in ('h', 'help'):
-            print(HELP_TEXT)
+            out(HELP_TEXT)
             continue
 
         if cmd in ('c', 'clear'):
             result = None
             calc.clear_history()
-            print("Cleared.")
+            out("Cleared.")
             continue
 
         if cmd == '=':
             if result is None:
-                print("No result yet.")
+                out("No result yet.")
             else:
-                print(f"= {_format_result(result)}")
+                out(f"= {_format_result(result)}")
             continue
 
         if cmd in ('history', 'hist'):
-            _display_history(calc.show_history())
+            _display_history(calc.show_history(), out)
             continue
 
         if cmd == 'undo':
             if calc.undo():
                 history = calc.show_history()
-                result = Decimal(str(history[-1].result)) if history else None
-                print("Undone.")
+                result = history[-1].result if history else None
+                out("Undone.")
             else:
-                print("Nothing to undo.")
+                out("Nothing to undo.")
             continue
 
         if cmd == 'redo':
             if calc.redo():
                 history = calc.show_history()
-                result = Decimal(str(history[-1].result)) if history else None
-                print("Redone.")
+                result = history[-1].result if history else None
+                out("Redone.")
             else:
-                print("Nothing to redo.")
+                out("Nothing to redo.")
             continue
 
         if cmd == 'save':
             try:
                 calc.save_history()
-                print("History saved.")
+                out("History saved.")
             except Exception as exc:
-                print(f"Error saving history: {exc}")
+                out(f"Error saving history: {exc}")
             continue
 
         if cmd == 'load':
             try:
                 calc.load_history()
                 history = calc.show_history()
-                result = Decimal(str(history[-1].result)) if history else None
-                print("History loaded.")
+                result = history[-1].result if history else None
+                out("History loaded.")
             except Exception as exc:
-                print(f"Error loading history: {exc}")
+                out(f"Error loading history: {exc}")
             continue
 
         # --- keyword operations: power / root --------------------------------
@@ -164,38 +203,38 @@ def calculator_repl() -> None:
             try:
                 calc.set_operation(OperationFactory.create_operation(op_name))
                 result = calc.perform_operation(parts[1], parts[2])
-                print(_format_result(result))
+                out(_format_result(result))
             except (ValidationError, OperationError) as exc:
-                print(f"Error: {exc}")
+                out(f"Error: {exc}")
             continue
 
         # --- infix expressions: "a op b" or "op b" ---------------------------
 
-        match = InputValidator.validate_expression(raw)
-        if not match:
-            print("Error: Unrecognised input. Type 'h' for help.")
+        parsed = InputValidator.validate_expression(raw)
+        if not parsed:
+            out("Error: Unrecognised input. Type 'h' for help.")
             continue
 
         try:
-            if match.group(1) is not None:
-                # Full expression: a op b
-                a_str = match.group(1).replace(' ', '')
-                op_symbol = match.group(2)
-                b_str = match.group(3).replace(' ', '')
+            if parsed.a is not None:
+                # Full expression: a op b — tokens arrive whitespace-free
+                a_str = parsed.a
+                op_symbol = parsed.op
+                b_str = parsed.b
             else:
                 # Continuation: op b  (uses last result as a)
                 if result is None:
-                    print("Error: No previous result. Start with a full expression, e.g. '1 + 2'.")
+                    out("Error: No previous result. Start with a full expression, e.g. '1 + 2'.")
                     continue
                 a_str = str(result)
-                op_symbol = match.group(4)
-                b_str = match.group(5).replace(' ', '')
+                op_symbol = parsed.op
+                b_str = parsed.b
 
-            calc.set_operation(OperationFactory.create_operation(OPERATOR_MAP[op_symbol]))
+            calc.set_operation(_INFIX[op_symbol])
             result = calc.perform_operation(a_str, b_str)
-            print(_format_result(result))
+            out(_format_result(result))
 
         except (ValidationError, OperationError) as exc:
-            print(f"Error: {exc}")
+            out(f"Error: {exc}")
         except Exception as exc:
-            print(f"Unexpected error: {exc}")
+            out(f"Unexpected error: {exc}")
@@ -64,13 +64,18 @@ class AutoSaveObserver(HistoryObserver):
     feature is enabled in the configuration.
     """
 
-    def __init__(self, calculator: Any):
+    def __init__(self, calculator: Any, flush_threshold: int = 1):
         """
         Initialize the AutoSaveObserver.
 
         Args:
             calculator (Any): The calculator instance to interact with.
                 Must have 'config' and 'save_history' attributes.
+            flush_threshold (int): Number of calculations to accumulate before
+                writing the history file. The default of 1 saves after every
+                calculation; larger values coalesce several calculations into
+                one write (the REPL quit path still saves unconditionally, so
+                pending entries are never lost on a clean exit).
 
         Raises:
             TypeError: If the calculator does not have the required attributes.
@@ -78,19 +83,26 @@ class AutoSaveObserver(HistoryObserver):
         if not hasattr(calculator, 'config') or not hasattr(calculator, 'save_history'):
             raise TypeError("Calculator must have 'config' and 'save_history' attributes")
         self.calculator = calculator
+        self.flush_threshold = flush_threshold
+        self._pending = 0
 
     def update(self, calculation: Calculation) -> None:
         """
         Trigger auto-save.
 
         This method is called whenever a new calculation is performed. If the
-        auto-save feature is enabled, it saves the current calculation history.
+        auto-save feature is enabled, it saves the current calculation history
+        once enough calculations have accumulated to reach the flush threshold.
 
         Args:
             calculation (Calculation): The calculation that was performed.
         """
         if calculation is None:
             raise AttributeError("Calculation cannot be None")
-        if self.calculator.config.auto_save:
+        if not self.calculator.config.auto_save:
+            return
+        self._pending += 1
+        if self._pending >= self.flush_threshold:
             self.calculator.save_history()
+            self._pending = 0
             logging.info("History auto-saved")
\ No newline at end of file
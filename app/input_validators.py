@@ -2,38 +2,87 @@
 # Input Validation     #
 ########################
 
-import re
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional
+from math import isfinite
+from typing import Any, NamedTuple, Optional, Tuple
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ValidationError
 
-# Matches either a full expression "a op b" or a continuation "op b".
-# Group layout:
-#   Full:         (1) a   (2) op   (3) b
-#   Continuation: (4) op  (5) b
-EXPRESSION_PATTERN = re.compile(
-    r'([+-]?\s*\d+(?:\.\d+)?)\s*([+\-*/])\s*([+-]?\s*\d+(?:\.\d+)?)'
-    r'|([+\-*/])\s*([+-]?\s*\d+(?:\.\d+)?)'
-)
+# Operator characters accepted in infix expressions.
+_OPERATORS = frozenset('+-*/')
+
+
+class ParsedExpression(NamedTuple):
+    """Tokens scanned from a raw expression string.
+
+    ``a`` is None for continuation input ("op b"), where the REPL substitutes
+    its previous result. Operand tokens are normalized during the scan — any
+    whitespace between a sign and its digits is dropped — so they can be fed
+    straight to a number parser.
+    """
+
+    a: Optional[str]
+    op: str
+    b: str
+
+
+def _scan_operand(raw: str, i: int) -> Tuple[Optional[str], int]:
+    """
+    Scan one operand ``[+-]? ws* digits [. digits]`` starting at index i.
+
+    The returned token never contains whitespace: the sign is glued straight
+    onto the digits, so callers can pass it to Decimal/float unmodified.
+
+    Returns:
+        (token, next_index) on success, or (None, i) if no operand starts here.
+    """
+    n = len(raw)
+    start = i
+    sign = ''
+    if i < n and raw[i] in '+-':
+        sign = raw[i]
+        i += 1
+        while i < n and raw[i].isspace():
+            i += 1
+    digits_start = i
+    while i < n and '0' <= raw[i] <= '9':
+        i += 1
+    if i == digits_start:
+        return None, start
+    if i < n and raw[i] == '.':
+        j = i + 1
+        while j < n and '0' <= raw[j] <= '9':
+            j += 1
+        if j > i + 1:
+            i = j
+    return sign + raw[digits_start:i], i
+
+
+def _skip_ws(raw: str, i: int) -> int:
+    """Return the index of the first non-whitespace character at or after i."""
+    n = len(raw)
+    while i < n and raw[i].isspace():
+        i += 1
+    return i
+
 
 @dataclass
 class InputValidator:
     """Validates and sanitizes calculator inputs."""
-    
+
     @staticmethod
     def validate_number(value: Any, config: CalculatorConfig) -> Decimal:
         """
         Validate and convert input to Decimal.
-        
+
         Args:
             value: Input value to validate
             config: Calculator configuration
-            
+
         Returns:
             Decimal: Validated and converted number
-            
+
         Raises:
             ValidationError: If input is invalid
         """
@@ -48,16 +97,69 @@ class InputValidator:
             raise ValidationError(f"Invalid number format: {value}") from e
 
     @staticmethod
-    def validate_expression(raw: str) -> Optional[re.Match]:
+    def validate_number_fast(value: Any, config: CalculatorConfig) -> float:
+        """
+        Validate and convert input to float, skipping the Decimal round-trip.
+
+        Used when CalculatorConfig.use_decimal is disabled: float parsing is
+        roughly an order of magnitude cheaper than Decimal construction plus
+        normalize(), at the cost of binary floating-point rounding.
+
+        Args:
+            value: Input value to validate
+            config: Calculator configuration
+
+        Returns:
+            float: Validated and converted number
+
+        Raises:
+            ValidationError: If input is invalid
+        """
+        try:
+            number = float(value)
+        except (TypeError, ValueError) as e:
+            raise ValidationError(f"Invalid number format: {value}") from e
+        # float() happily parses "nan"/"inf", which Decimal inputs never
+        # produce and which would blow up the Decimal comparison below.
+        if not isfinite(number):
+            raise ValidationError(f"Invalid number format: {value}")
+        if abs(number) > config.max_input_value:
+            raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
+        return number
+
+    @staticmethod
+    def validate_expression(raw: str) -> Optional[ParsedExpression]:
         """
-        Validate a raw expression string against the calculator input pattern.
+        Validate a raw expression string against the calculator input grammar.
 
         Accepts either a full expression ("a op b") or a continuation ("op b").
+        Uses a direct character scan rather than a regex: the grammar is fixed
+        and tiny, so a single forward pass beats backtracking and avoids
+        building a match object per input.
 
         Args:
             raw: The raw input string to validate.
 
         Returns:
-            re.Match: The match object if valid, or None if the input is unrecognized.
+            ParsedExpression: The scanned tokens if valid (``a`` is None for
+            continuations), or None if the input is unrecognized.
         """
-        return EXPRESSION_PATTERN.fullmatch(raw)
\ No newline at end of file
+        n = len(raw)
+
+        # Full expression: a op b
+        a, i = _scan_operand(raw, 0)
+        if a is not None:
+            j = _skip_ws(raw, i)
+            if j < n and raw[j] in _OPERATORS:
+                op = raw[j]
+                b, k = _scan_operand(raw, _skip_ws(raw, j + 1))
+                if b is not None and k == n:
+                    return ParsedExpression(a, op, b)
+
+        # Continuation: op b (previous result becomes the first operand)
+        if n and raw[0] in _OPERATORS:
+            b, k = _scan_operand(raw, _skip_ws(raw, 1))
+            if b is not None and k == n:
+                return ParsedExpression(None, raw[0], b)
+
+        return None
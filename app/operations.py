@@ -17,6 +17,10 @@ class Operation(ABC):
     implement the execute method and can optionally override operand validation.
     """
 
+    # Operations are stateless singletons; __slots__ keeps them dict-free and
+    # makes attribute access a fixed-offset load.
+    __slots__ = ()
+
     name: str = ''
 
     @abstractmethod
@@ -51,6 +55,8 @@ class Operation(ABC):
 class Addition(Operation):
     """Addition operation implementation."""
 
+    __slots__ = ()
+
     name = 'add'
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -61,6 +67,8 @@ class Addition(Operation):
 class Subtraction(Operation):
     """Subtraction operation implementation."""
 
+    __slots__ = ()
+
     name = 'subtract'
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -71,6 +79,8 @@ class Subtraction(Operation):
 class Multiplication(Operation):
     """Multiplication operation implementation."""
 
+    __slots__ = ()
+
     name = 'multiply'
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -81,11 +91,15 @@ class Multiplication(Operation):
 class Division(Operation):
     """Division operation implementation."""
 
+    __slots__ = ()
+
     name = 'divide'
 
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         super().validate_operands(a, b)
-        if b == 0:
+        # Truthiness is the cheapest zero test and works for Decimal and float
+        # operands alike, unlike Decimal.is_zero().
+        if not b:
             raise ValidationError("Division by zero is not allowed")
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -96,6 +110,8 @@ class Division(Operation):
 class Power(Operation):
     """Exponentiation operation implementation."""
 
+    __slots__ = ()
+
     name = 'power'
 
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
@@ -111,13 +127,15 @@ class Power(Operation):
 class Root(Operation):
     """Root (nth root) operation implementation."""
 
+    __slots__ = ()
+
     name = 'root'
 
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         super().validate_operands(a, b)
         if a < 0:
             raise ValidationError("Cannot calculate root of negative number")
-        if b == 0:
+        if not b:
             raise ValidationError("Zero root is undefined")
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -143,6 +161,10 @@ class OperationFactory:
         'root': Root,
     }
 
+    # Operations are stateless, so one shared instance per type suffices;
+    # create_operation fills this cache lazily and reuses it thereafter.
+    _instances: Dict[str, Operation] = {}
+
     @classmethod
     def register_operation(cls, name: str, operation_class: type) -> None:
         """
@@ -157,23 +179,35 @@ class OperationFactory:
         """
         if not issubclass(operation_class, Operation):
             raise TypeError("Operation class must inherit from Operation")
-        cls._operations[name.lower()] = operation_class
+        key = name.lower()
+        cls._operations[key] = operation_class
+        # Drop any cached instance of a previously registered class under
+        # this name so the next create_operation builds the new one.
+        cls._instances.pop(key, None)
 
     @classmethod
     def create_operation(cls, operation_type: str) -> Operation:
         """
-        Create an operation instance based on the operation type.
+        Return the shared operation instance for the given operation type.
+
+        Operation strategies carry no per-instance state, so the factory
+        memoizes one instance per type instead of constructing a fresh
+        object on every call.
 
         Args:
             operation_type (str): The type of operation to create (e.g., 'add').
 
         Returns:
-            Operation: An instance of the specified operation class.
+            Operation: The shared instance of the specified operation class.
 
         Raises:
             ValueError: If the operation type is unknown.
         """
-        operation_class = cls._operations.get(operation_type.lower())
-        if not operation_class:
-            raise ValueError(f"Unknown operation: {operation_type}")
-        return operation_class()
+        key = operation_type.lower()
+        instance = cls._instances.get(key)
+        if instance is None:
+            operation_class = cls._operations.get(key)
+            if not operation_class:
+                raise ValueError(f"Unknown operation: {operation_type}")
+            instance = cls._instances[key] = operation_class()
+        return instance
@@ -0,0 +1,66 @@
+import contextlib
+import io
+import logging
+
+import pytest
+
+from app.calculation import AddCalculation
+from app.calculator_repl import calculator_repl
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _quiet_logs():
+    """Silence log emission for the whole test session.
+
+    Operations and observers log on every calculation; with file handlers
+    configured that is real I/O multiplied by every test. Tests that
+    assert on logging patch logging.info itself, which bypasses the
+    disable check, so they are unaffected.
+    """
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session")
+def add_cls():
+    """The AddCalculation class, resolved once for the whole session.
+
+    Tests that only need an 'add' instance construct it directly instead
+    of going through the factory's registry lookup each time.
+    """
+    return AddCalculation
+
+
+@pytest.fixture(scope="session")
+def run_repl():
+    """Drive calculator_repl() with a scripted input sequence, return stdout.
+
+    Session-scoped with an output cache keyed on the input tuple: the many
+    pure-output tests (quit, help, empty input, ...) that feed identical
+    scripts reuse the captured output of the first run instead of booting
+    the whole REPL again.
+
+    Both the input patch and the stdout redirection are context managers,
+    so sys.stdout and builtins.input are restored even when the REPL
+    raises — a failing test can never leave stdout redirected for the
+    rest of the session.
+    """
+    cache = {}
+
+    def _run(inputs):
+        key = tuple(inputs)
+        if key not in cache:
+            buffer = io.StringIO()
+            with pytest.MonkeyPatch.context() as mp:
+                # Bind the iterator's __next__ as a default argument so each
+                # input() call is one bound-method call, not a global next()
+                # lookup plus dispatch.
+                mp.setattr('builtins.input',
+                           lambda _prompt='', _next=iter(key).__next__: _next())
+                with contextlib.redirect_stdout(buffer):
+                    calculator_repl()
+            cache[key] = buffer.getvalue()
+        return cache[key]
+
+    return _run
@@ -7,61 +7,32 @@ from app.exceptions import ValidationError
 # Basic arithmetic
 # ---------------------------------------------------------------------------
 
-def test_addition():
-    calc = CalculationFactory.create_calculation('add', 2.0, 3.0)
-    assert calc.result == 5.0
-
-
-def test_subtraction():
-    calc = CalculationFactory.create_calculation('subtract', 5.0, 3.0)
-    assert calc.result == 2.0
-
-
-def test_multiplication():
-    calc = CalculationFactory.create_calculation('multiply', 4.0, 2.0)
-    assert calc.result == 8.0
-
-
-def test_division():
-    calc = CalculationFactory.create_calculation('divide', 8.0, 2.0)
-    assert calc.result == 4.0
-
-
-def test_power():
-    calc = CalculationFactory.create_calculation('power', 2.0, 3.0)
-    assert calc.result == 8.0
-
-
-def test_root():
-    calc = CalculationFactory.create_calculation('root', 16.0, 2.0)
-    assert calc.result == 4.0
+@pytest.mark.parametrize("op,a,b,expected", [
+    ('add', 2.0, 3.0, 5.0),
+    ('subtract', 5.0, 3.0, 2.0),
+    ('multiply', 4.0, 2.0, 8.0),
+    ('divide', 8.0, 2.0, 4.0),
+    ('power', 2.0, 3.0, 8.0),
+    ('root', 16.0, 2.0, 4.0),
+])
+def test_arithmetic(op, a, b, expected):
+    calc = CalculationFactory.create_calculation(op, a, b)
+    assert calc.result == expected
 
 
 # ---------------------------------------------------------------------------
 # Error cases (errors raised when result is accessed)
 # ---------------------------------------------------------------------------
 
-def test_division_by_zero():
-    calc = CalculationFactory.create_calculation('divide', 8.0, 0.0)
-    with pytest.raises(ValidationError, match="Division by zero is not allowed"):
-        _ = calc.result
-
-
-def test_negative_power():
-    calc = CalculationFactory.create_calculation('power', 2.0, -3.0)
-    with pytest.raises(ValidationError, match="Negative exponents not supported"):
-        _ = calc.result
-
-
-def test_invalid_root_negative_base():
-    calc = CalculationFactory.create_calculation('root', -16.0, 2.0)
-    with pytest.raises(ValidationError, match="Cannot calculate root of negative number"):
-        _ = calc.result
-
-
-def test_invalid_root_zero_degree():
-    calc = CalculationFactory.create_calculation('root', 9.0, 0.0)
-    with pytest.raises(ValidationError, match="Zero root is undefined"):
+@pytest.mark.parametrize("op,a,b,match", [
+    ('divide', 8.0, 0.0, "Division by zero is not allowed"),
+    ('power', 2.0, -3.0, "Negative exponents not supported"),
+    ('root', -16.0, 2.0, "Cannot calculate root of negative number"),
+    ('root', 9.0, 0.0, "Zero root is undefined"),
+])
+def test_invalid_operands(op, a, b, match):
+    calc = CalculationFactory.create_calculation(op, a, b)
+    with pytest.raises(ValidationError, match=match):
         _ = calc.result
 
 
@@ -74,9 +45,14 @@ def test_unknown_operation():
 # Observer-compatible properties
 # ---------------------------------------------------------------------------
 
-def test_operation_property():
-    calc = CalculationFactory.create_calculation('add', 2.0, 3.0)
-    assert calc.operation == 'add'
+@pytest.fixture(scope="module")
+def add_calc(add_cls):
+    """Shared AddCalculation(2.0, 3.0) for the read-only assertions below."""
+    return add_cls(2.0, 3.0)
+
+
+def test_operation_property(add_calc):
+    assert add_calc.operation == 'add'
 
 
 def test_operand_properties():
@@ -89,9 +65,8 @@ def test_operand_properties():
 # Serialisation
 # ---------------------------------------------------------------------------
 
-def test_to_dict():
-    calc = CalculationFactory.create_calculation('add', 2.0, 3.0)
-    assert calc.to_dict() == {
+def test_to_dict(add_calc):
+    assert add_calc.to_dict() == {
         'operation': 'add',
         'operand1': 2.0,
         'operand2': 3.0,
@@ -118,16 +93,14 @@ def test_from_dict_invalid_operand():
 # String representations
 # ---------------------------------------------------------------------------
 
-def test_str_representation():
-    calc = CalculationFactory.create_calculation('add', 2.0, 3.0)
-    s = str(calc)
+def test_str_representation(add_calc):
+    s = str(add_calc)
     assert 'AddCalculation' in s
     assert '5' in s
 
 
-def test_repr_representation():
-    calc = CalculationFactory.create_calculation('add', 2.0, 3.0)
-    assert repr(calc) == 'AddCalculation(a=2.0, b=3.0)'
+def test_repr_representation(add_calc):
+    assert repr(add_calc) == 'AddCalculation(a=2.0, b=3.0)'
 
 
 # ---------------------------------------------------------------------------
@@ -135,7 +108,11 @@ def test_repr_representation():
 # ---------------------------------------------------------------------------
 
 def test_register_duplicate_raises():
+    # Precondition: 'add' is already registered, so the guard must fire.
+    assert 'add' in CalculationFactory._calculations
+
+    class Dummy:
+        """Stand-in class; the duplicate guard rejects it before use."""
+
     with pytest.raises(ValueError, match="already registered"):
-        CalculationFactory.register_calculation('add')(
-            CalculationFactory._calculations['add']
-        )
+        CalculationFactory.register_calculation('add')(Dummy)
@@ -1,12 +1,16 @@
+import os
+import sys
+
 import pytest
 from decimal import Decimal
-from unittest.mock import patch
+from functools import lru_cache
+from unittest.mock import Mock
 
 from app.calculator import Calculator
 from app.calculator_config import CalculatorConfig
 from app.calculator_memento import CalculatorMemento
 from app.calculator_repl import calculator_repl
-from app.exceptions import OperationError, ValidationError
+from app.exceptions import ConfigurationError, OperationError, ValidationError
 from app.history import LoggingObserver, HistoryObserver
 from app.operations import OperationFactory
 
@@ -21,20 +25,63 @@ _CALC_ENV_VARS = [
     'CALCULATOR_HISTORY_FILE',
     'CALCULATOR_LOG_DIR',
     'CALCULATOR_LOG_FILE',
+    'CALCULATOR_MAX_HISTORY_SIZE',
+    'CALCULATOR_AUTO_SAVE',
+    'CALCULATOR_PRECISION',
+    'CALCULATOR_MAX_INPUT_VALUE',
+    'CALCULATOR_DEFAULT_ENCODING',
 ]
 
 
+@lru_cache(maxsize=None)
+def _op(name):
+    """Shared Operation instance for name.
+
+    The factory already hands out memoized instances; caching here also
+    skips the classmethod dispatch on the dozens of call sites below.
+    Operations are stateless (__slots__ = ()), so sharing is safe.
+    """
+    return OperationFactory.create_operation(name)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _clean_calc_env():
+    """Clear the CalculatorConfig env overrides once for this module.
+
+    Module- rather than session-scoped on purpose: test_config.py sets
+    these variables at import time and its tests still expect them, so
+    they are restored as soon as this module finishes.
+    """
+    saved = {var: os.environ.pop(var, None) for var in _CALC_ENV_VARS}
+    yield
+    os.environ.update({k: v for k, v in saved.items() if v is not None})
+
+
+@pytest.fixture(scope="module")
+def _calculator_singleton(tmp_path_factory, _clean_calc_env):
+    """One Calculator over a temporary base directory, shared by the module."""
+    config = CalculatorConfig(base_dir=tmp_path_factory.mktemp('calc'),
+                              auto_save=False)
+    # Pre-create the history directory so persistence tests skip the
+    # per-test mkdir round trip.
+    config.history_dir.mkdir(parents=True, exist_ok=True)
+    yield Calculator(config=config)
+
+
 @pytest.fixture
-def calculator(tmp_path, monkeypatch):
-    """Calculator with a temporary base directory and auto-save disabled.
+def calculator(_calculator_singleton):
+    """Per-test handle on the shared Calculator, reset between tests.
 
-    Environment variables that override CalculatorConfig paths are cleared so
-    that the tmp_path is actually used.
+    Config construction and directory creation are amortized across the
+    module; the per-test work is only clearing history, observers, the
+    current operation, and any history file a persistence test wrote.
     """
-    for var in _CALC_ENV_VARS:
-        monkeypatch.delenv(var, raising=False)
-    config = CalculatorConfig(base_dir=tmp_path, auto_save=False)
-    return Calculator(config=config)
+    calc = _calculator_singleton
+    yield calc
+    calc.clear_history()
+    calc._observers.clear()
+    calc._operation = None
+    calc.config.history_file.unlink(missing_ok=True)
 
 
 # ---------------------------------------------------------------------------
@@ -42,7 +89,7 @@ def calculator(tmp_path, monkeypatch):
 # ---------------------------------------------------------------------------
 
 def test_calculator_initialization(calculator):
-    assert calculator.show_history() == []
+    assert calculator.show_history() == ()
     assert calculator._undo_stack == []
     assert calculator._redo_stack == []
     assert calculator._operation is None
@@ -71,7 +118,7 @@ def test_observer_notified_after_calculation(calculator):
             notified.append(calculation)
 
     calculator.add_observer(CapturingObserver())
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('2', '3')
     assert len(notified) == 1
     assert notified[0].operation == 'add'
@@ -82,7 +129,7 @@ def test_observer_notified_after_calculation(calculator):
 # ---------------------------------------------------------------------------
 
 def test_set_operation(calculator):
-    operation = OperationFactory.create_operation('add')
+    operation = _op('add')
     calculator.set_operation(operation)
     assert calculator._operation is operation
 
@@ -91,24 +138,25 @@ def test_set_operation(calculator):
 # perform_operation
 # ---------------------------------------------------------------------------
 
-def test_perform_operation_addition(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
-    assert calculator.perform_operation('2', '3') == Decimal('5')
-
-
-def test_perform_operation_subtraction(calculator):
-    calculator.set_operation(OperationFactory.create_operation('subtract'))
-    assert calculator.perform_operation('10', '4') == Decimal('6')
+@pytest.mark.parametrize("op,a,b,expected", [
+    ('add', '2', '3', Decimal('5')),
+    ('subtract', '10', '4', Decimal('6')),
+    ('multiply', '3', '4', Decimal('12')),
+    ('divide', '10', '2', Decimal('5')),
+])
+def test_perform_operation_basic(calculator, op, a, b, expected):
+    calculator.set_operation(_op(op))
+    assert calculator.perform_operation(a, b) == expected
 
 
-def test_perform_operation_multiplication(calculator):
-    calculator.set_operation(OperationFactory.create_operation('multiply'))
-    assert calculator.perform_operation('3', '4') == Decimal('12')
-
-
-def test_perform_operation_division(calculator):
-    calculator.set_operation(OperationFactory.create_operation('divide'))
-    assert calculator.perform_operation('10', '2') == Decimal('5')
+def test_perform_operation_float_mode(tmp_path):
+    """With use_decimal disabled, operands and result stay plain floats."""
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=False, use_decimal=False)
+    calc = Calculator(config=config)
+    calc.set_operation(_op('add'))
+    result = calc.perform_operation('2.5', '3')
+    assert isinstance(result, float)
+    assert result == 5.5
 
 
 def test_perform_operation_no_operation_set(calculator):
@@ -117,19 +165,19 @@ def test_perform_operation_no_operation_set(calculator):
 
 
 def test_perform_operation_invalid_input(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_op('add'))
     with pytest.raises(ValidationError):
         calculator.perform_operation('invalid', '3')
 
 
 def test_perform_operation_division_by_zero(calculator):
-    calculator.set_operation(OperationFactory.create_operation('divide'))
+    calculator.set_operation(_op('divide'))
     with pytest.raises(OperationError, match="Division by zero is not allowed"):
         calculator.perform_operation('8', '0')
 
 
 def test_perform_operation_records_history(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('2', '3')
     history = calculator.show_history()
     assert len(history) == 1
@@ -142,10 +190,10 @@ def test_perform_operation_records_history(calculator):
 # ---------------------------------------------------------------------------
 
 def test_undo_removes_last_entry(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('2', '3')
     assert calculator.undo() is True
-    assert calculator.show_history() == []
+    assert calculator.show_history() == ()
 
 
 def test_undo_empty_returns_false(calculator):
@@ -153,7 +201,7 @@ def test_undo_empty_returns_false(calculator):
 
 
 def test_redo_reapplies_entry(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('2', '3')
     calculator.undo()
     assert calculator.redo() is True
@@ -165,7 +213,7 @@ def test_redo_empty_returns_false(calculator):
 
 
 def test_undo_redo_sequence(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('1', '1')
     calculator.perform_operation('2', '2')
     calculator.undo()
@@ -178,19 +226,19 @@ def test_undo_redo_sequence(calculator):
 # History management
 # ---------------------------------------------------------------------------
 
-def test_show_history_returns_copy(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+def test_show_history_returns_readonly_view(calculator):
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('2', '3')
-    h1 = calculator.show_history()
-    h1.clear()
+    history = calculator.show_history()
+    assert isinstance(history, tuple)
     assert len(calculator.show_history()) == 1
 
 
 def test_clear_history(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('2', '3')
     calculator.clear_history()
-    assert calculator.show_history() == []
+    assert calculator.show_history() == ()
     assert calculator._undo_stack == []
     assert calculator._redo_stack == []
 
@@ -200,12 +248,12 @@ def test_clear_history(calculator):
 # ---------------------------------------------------------------------------
 
 def test_save_and_load_history(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('2', '3')
     calculator.save_history()
 
     calculator.clear_history()
-    assert calculator.show_history() == []
+    assert calculator.show_history() == ()
 
     calculator.load_history()
     history = calculator.show_history()
@@ -218,95 +266,91 @@ def test_save_and_load_history(calculator):
 def test_load_history_no_file(calculator):
     """load_history is a no-op when the file does not exist."""
     calculator.load_history()
-    assert calculator.show_history() == []
+    assert calculator.show_history() == ()
 
 
 def test_save_history_creates_file(calculator):
-    calculator.set_operation(OperationFactory.create_operation('multiply'))
+    calculator.set_operation(_op('multiply'))
     calculator.perform_operation('3', '4')
     calculator.save_history()
     assert calculator.config.history_file.exists()
 
 
-# ---------------------------------------------------------------------------
-# REPL — expression-based input
-# ---------------------------------------------------------------------------
-
-@patch('builtins.input', side_effect=['q'])
-@patch('builtins.print')
-def test_repl_quit(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("Exiting")
-
-
-@patch('builtins.input', side_effect=['h', 'q'])
-@patch('builtins.print')
-def test_repl_help(mock_print, mock_input):
-    calculator_repl()
-    printed = ' '.join(
-        str(call.args[0]) for call in mock_print.call_args_list if call.args
-    )
-    assert 'Supported infix operators' in printed
-
-
-@patch('builtins.input', side_effect=['1 + 2', 'q'])
-@patch('builtins.print')
-def test_repl_addition(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call('3')
-
+def test_feather_save_and_load_roundtrip(tmp_path):
+    """Feather-format history survives a save/load round trip."""
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=False,
+                              history_format='feather')
+    calc = Calculator(config=config)
+    calc.set_operation(_op('add'))
+    calc.perform_operation('2', '3')
+    calc.save_history()
 
-@patch('builtins.input', side_effect=['10 / 2', 'q'])
-@patch('builtins.print')
-def test_repl_division(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call('5')
-
-
-@patch('builtins.input', side_effect=['power 2 8', 'q'])
-@patch('builtins.print')
-def test_repl_power(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call('256')
-
-
-@patch('builtins.input', side_effect=['9 / 0', 'q'])
-@patch('builtins.print')
-def test_repl_division_by_zero(mock_print, mock_input):
-    calculator_repl()
-    printed = ' '.join(
-        str(call.args[0]) for call in mock_print.call_args_list if call.args
-    )
-    assert 'Error' in printed
-
-
-@patch('builtins.input', side_effect=['1 + 2', 'undo', 'q'])
-@patch('builtins.print')
-def test_repl_undo(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call('Undone.')
+    calc.clear_history()
+    calc.load_history()
+    history = calc.show_history()
+    assert len(history) == 1
+    assert history[0].operation == 'add'
+    assert history[0].operand1 == 2.0
+    assert history[0].operand2 == 3.0
 
 
-@patch('builtins.input', side_effect=['c', 'q'])
-@patch('builtins.print')
-def test_repl_clear(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call('Cleared.')
+def test_feather_load_skips_invalid_entries(tmp_path):
+    """Rows that cannot be rebuilt are skipped, mirroring the CSV loader."""
+    import pyarrow as pa
+    from pyarrow import feather
+
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=False,
+                              history_format='feather')
+    calc = Calculator(config=config)
+    config.history_dir.mkdir(parents=True, exist_ok=True)
+    table = pa.table({
+        'operation': ['add', 'bad_op'],
+        'operand1': [2.0, 1.0],
+        'operand2': [3.0, 1.0],
+        'result': [5.0, 2.0],
+    })
+    feather.write_feather(table, config.history_file,
+                          compression='uncompressed')
+    calc.load_history()
+    assert len(calc.show_history()) == 1
+    assert calc.show_history()[0].operation == 'add'
+
+
+@pytest.mark.parametrize("action", ['save', 'load'])
+def test_feather_without_pyarrow_raises(tmp_path, monkeypatch, action):
+    """Both feather paths surface a ConfigurationError when pyarrow is absent."""
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=False,
+                              history_format='feather')
+    calc = Calculator(config=config)
+    if action == 'load':
+        config.history_dir.mkdir(parents=True, exist_ok=True)
+        config.history_file.write_bytes(b'')
+    with pytest.raises(ConfigurationError, match="requires the pyarrow package"):
+        getattr(calc, f"{action}_history")()
 
 
 # ---------------------------------------------------------------------------
 # Persistence — corrupt CSV rows (calculator.py lines 236-237)
 # ---------------------------------------------------------------------------
 
-def test_load_history_skips_corrupt_rows(calculator):
+# Header plus one valid row, pre-encoded once; each test appends a
+# malformed row variant and writes the bytes straight through.
+_HISTORY_CSV_PREFIX_BYTES = (
+    b"operation,operand1,operand2,result\n"
+    b"add,2,3,5\n"
+)
+
+
+@pytest.mark.parametrize("bad_row", [
+    b"bad_op,2,3,5",        # ValueError: unknown operation
+    b"add,not_a_num,3,5",   # InvalidOperation: unparseable operand
+    b"add,2",               # IndexError: too few fields
+])
+def test_load_history_skips_corrupt_rows(calculator, bad_row):
     """Invalid CSV rows are skipped; valid rows are still loaded."""
-    calculator.config.history_dir.mkdir(parents=True, exist_ok=True)
-    calculator.config.history_file.write_text(
-        "operation,operand1,operand2,result\n"
-        "add,2,3,5\n"           # valid
-        "bad_op,2,3,5\n"        # ValueError: unknown operation
-        "add,not_a_num,3,5\n",  # ValueError: float() conversion
-        encoding=calculator.config.default_encoding,
+    calculator.config.history_file.write_bytes(
+        _HISTORY_CSV_PREFIX_BYTES + bad_row + b"\n"
     )
     calculator.load_history()
     assert len(calculator.show_history()) == 1
@@ -317,211 +361,267 @@ def test_load_history_skips_corrupt_rows(calculator):
 # CalculatorMemento (calculator_memento.py lines 34, 53)
 # ---------------------------------------------------------------------------
 
-def test_memento_to_dict(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+def test_memento_roundtrip(calculator):
+    """to_dict produces the expected shape and from_dict restores it."""
+    calculator.set_operation(_op('add'))
     calculator.perform_operation('2', '3')
     memento = CalculatorMemento(list(calculator.show_history()))
+
     d = memento.to_dict()
-    assert 'history' in d
     assert 'timestamp' in d
     assert len(d['history']) == 1
     assert d['history'][0]['operation'] == 'add'
 
-
-def test_memento_from_dict(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
-    calculator.perform_operation('2', '3')
-    memento = CalculatorMemento(list(calculator.show_history()))
-    restored = CalculatorMemento.from_dict(memento.to_dict())
+    restored = CalculatorMemento.from_dict(d)
     assert len(restored.history) == 1
     assert restored.history[0].operation == 'add'
 
 
 # ---------------------------------------------------------------------------
-# REPL — additional branch coverage
+# REPL
 # ---------------------------------------------------------------------------
 
-@patch('builtins.input', side_effect=['1 / 4', 'q'])
-@patch('builtins.print')
-def test_repl_fractional_result(mock_print, mock_input):
-    """_format_result returns str(value) for non-integer results (line 46)."""
-    calculator_repl()
-    printed = ' '.join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
-    assert '0.25' in printed
-
-
-@patch('builtins.input', side_effect=['history', 'q'])
-@patch('builtins.print')
-def test_repl_history_empty(mock_print, mock_input):
-    """_display_history prints the empty message when no history (lines 50-52)."""
-    calculator_repl()
-    mock_print.assert_any_call('No calculations in history yet.')
-
-
-@patch('builtins.input', side_effect=['1 + 2', 'history', 'q'])
-@patch('builtins.print')
-def test_repl_history_with_entries(mock_print, mock_input):
-    """_display_history prints entries when history is non-empty (lines 53-56)."""
-    calculator_repl()
-    printed = ' '.join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
-    assert 'Calculation History' in printed
-
-
-@patch('app.calculator_repl.Calculator', side_effect=Exception('init failed'))
-@patch('builtins.print')
-def test_repl_fatal_init_error(mock_print, mock_calc_class):
-    """Fatal Calculator init error is printed and re-raised (lines 71-74)."""
-    with pytest.raises(Exception, match='init failed'):
+# Scripts reused by several REPL tests; tuples so each use re-iterates a
+# shared immutable object instead of rebuilding a list per test.
+_ADD_Q = ('1 + 2', 'q')
+_SAVE_Q = ('save', 'q')
+_LOAD_Q = ('load', 'q')
+
+
+@pytest.mark.slow
+class TestREPL:
+    """End-to-end tests that drive calculator_repl() with scripted input.
+
+    Grouped in one class so pytest resolves the shared REPL fixtures per
+    container rather than re-walking the module for every item.
+    """
+
+    @staticmethod
+    def _script(*lines):
+        """input() replacement fed from a canned sequence of lines.
+
+        A plain closure over the iterator's __next__, so each prompt costs
+        one bound-method call with none of MagicMock's call recording.
+        """
+        nxt = iter(lines).__next__
+        return lambda _prompt='': nxt()
+
+    def _drive(self, monkeypatch, capsys, inputs, *, patches=()):
+        """Run the REPL over a scripted input sequence and return stdout.
+
+        patches are (target, ...) argument tuples forwarded verbatim to
+        monkeypatch.setattr before the REPL starts.
+        """
+        for spec in patches:
+            monkeypatch.setattr(*spec)
+        monkeypatch.setattr('builtins.input', self._script(*inputs))
+        calculator_repl()
+        return capsys.readouterr().out
+
+    @pytest.fixture(scope="module")
+    def _shared_calc(self, tmp_path_factory, _clean_calc_env):
+        """One Calculator instance reused by every REPL boot in this class."""
+        config = CalculatorConfig(base_dir=tmp_path_factory.mktemp('repl'),
+                                  auto_save=False)
+        return Calculator(config=config)
+
+    @pytest.fixture
+    def _noop_save(self, monkeypatch):
+        """Make save_history a no-op for tests that ignore persistence.
+
+        Every script ending in 'q' hits the quit branch, which saves the
+        history to disk; tests that never assert on that write opt in to
+        skip it.
+        """
+        monkeypatch.setattr(Calculator, 'save_history',
+                            lambda self, *args, **kwargs: None)
+
+    @pytest.fixture(autouse=True)
+    def _patch_repl_calc(self, monkeypatch, _shared_calc):
+        """Hand calculator_repl() a reset shared instance instead of a new one.
+
+        Calculator.__init__ (config validation, directory creation) is the
+        heaviest per-boot cost; the factory substitutes a cheap state reset.
+        Tests that exercise the construction failure path re-patch
+        app.calculator_repl.Calculator themselves and win.
+        """
+        def _factory(*args, **kwargs):
+            _shared_calc.clear_history()
+            _shared_calc._observers.clear()
+            _shared_calc._operation = None
+            _shared_calc.config.history_file.unlink(missing_ok=True)
+            return _shared_calc
+
+        monkeypatch.setattr('app.calculator_repl.Calculator', _factory)
+
+    @pytest.mark.parametrize("script,needle", [
+        (('q',), 'Exiting'),
+        (('quit',), 'Exiting'),
+        (('', 'q'), 'Exiting'),  # empty input is ignored, loop continues
+        (('h', 'q'), 'Supported infix operators'),
+        (('help', 'q'), 'Supported infix operators'),
+    ])
+    def test_repl_control(self, run_repl, _noop_save, script, needle):
+        """Quit/help commands and their aliases, plus blank-line handling."""
+        assert needle in run_repl(script)
+
+    @pytest.mark.parametrize("script,needle", [
+        (('1 + 2', 'q'), '3'),
+        (('10 / 2', 'q'), '5'),
+        (('power 2 8', 'q'), '256'),
+        (('1 / 4', 'q'), '0.25'),      # non-integer result formatting (line 46)
+        (('2.5 + 0.5', 'q'), '\n3\n'),  # Decimal('3.0'): integral-value fallback
+    ])
+    def test_repl_basic_operations(self, run_repl, _noop_save, script, needle):
+        assert needle in run_repl(script)
+
+    @pytest.mark.parametrize("script,needle", [
+        (('1.5 + 2.5', 'q'), '\n4\n'),  # integral float collapses to int form
+        (('1 / 4', 'q'), '0.25'),       # fractional float prints as-is
+    ])
+    def test_repl_float_mode(self, tmp_path, monkeypatch, capsys, _noop_save,
+                             script, needle):
+        """_format_result's float branch, with use_decimal disabled."""
+        config = CalculatorConfig(base_dir=tmp_path, auto_save=False,
+                                  use_decimal=False)
+        calc = Calculator(config=config)
+        monkeypatch.setattr('app.calculator_repl.Calculator',
+                            lambda *args, **kwargs: calc)
+        assert needle in self._drive(monkeypatch, capsys, script)
+
+    def test_repl_division_by_zero(self, monkeypatch, capsys, _noop_save):
+        assert 'Error' in self._drive(monkeypatch, capsys, ('9 / 0', 'q'))
+
+    def test_repl_undo(self, monkeypatch, capsys, _noop_save):
+        assert 'Undone.' in self._drive(monkeypatch, capsys, ('1 + 2', 'undo', 'q'))
+
+    def test_repl_clear(self, monkeypatch, capsys, _noop_save):
+        assert 'Cleared.' in self._drive(monkeypatch, capsys, ('c', 'q'))
+
+    @pytest.mark.parametrize("cmd", ['history', 'hist'])
+    @pytest.mark.parametrize("prelude,needle", [
+        ((), 'No calculations in history yet.'),
+        (('1 + 2',), 'Calculation History'),
+    ])
+    def test_repl_history_variants(self, run_repl, _noop_save, prelude, cmd, needle):
+        """_display_history for both command aliases, empty and populated."""
+        assert needle in run_repl(prelude + (cmd, 'q'))
+
+    def test_repl_fatal_init_error(self, monkeypatch, capsys):
+        """Fatal Calculator init error is printed and re-raised (lines 71-74)."""
+        monkeypatch.setattr('app.calculator_repl.Calculator',
+                            Mock(side_effect=Exception('init failed')))
+        with pytest.raises(Exception, match='init failed'):
+            calculator_repl()
+        assert 'Fatal error: init failed' in capsys.readouterr().out
+
+    @pytest.mark.parametrize("inputs,expected", [
+        (('=', 'q'), 'No result yet.'),
+        (('undo', 'q'), 'Nothing to undo.'),
+        (('redo', 'q'), 'Nothing to redo.'),
+        (('+ 3', 'q'), 'No previous result'),
+        (('xyz abc', 'q'), "Error: Unrecognised input. Type 'h' for help."),
+    ])
+    def test_repl_message_for_input(self, monkeypatch, capsys, _noop_save, inputs, expected):
+        """Commands and inputs that should produce a specific message."""
+        assert expected in self._drive(monkeypatch, capsys, inputs)
+
+    def test_repl_interactive_prompt(self, monkeypatch, capsys, _noop_save):
+        """Interactive sessions format the last result into the prompt."""
+        prompts = []
+        nxt = iter(('1 + 2', 'q')).__next__
+
+        def _input(prompt=''):
+            prompts.append(prompt)
+            return nxt()
+
+        monkeypatch.setattr(sys.stdin, 'isatty', lambda: True)
+        monkeypatch.setattr('builtins.input', _input)
+        calculator_repl()
+        assert prompts[0] == '> '
+        assert prompts[1] == '[3] > '
+
+    def test_repl_injected_io(self, _noop_save):
+        """The REPL runs purely on injected callables, bypassing builtins."""
+        lines = []
+        calculator_repl(
+            input_fn=self._script('1 + 2', 'q'),
+            output_fn=lambda *args: lines.append(' '.join(map(str, args))),
+        )
+        assert '3' in lines
+        assert 'Exiting' in lines
+
+    @pytest.mark.parametrize("exc", [EOFError, KeyboardInterrupt])
+    def test_repl_input_interrupted(self, monkeypatch, capsys, exc):
+        """EOFError and KeyboardInterrupt both exit the loop gracefully."""
+        def _raise(_prompt=''):
+            raise exc
+        monkeypatch.setattr('builtins.input', _raise)
         calculator_repl()
-    mock_print.assert_any_call('Fatal error: init failed')
-
-
-@patch('builtins.input', side_effect=EOFError)
-@patch('builtins.print')
-def test_repl_eof(mock_print, mock_input):
-    """EOFError exits the loop gracefully (lines 83-85)."""
-    calculator_repl()
-    mock_print.assert_any_call('\nExiting')
-
-
-@patch('builtins.input', side_effect=['', 'q'])
-@patch('builtins.print')
-def test_repl_empty_input(mock_print, mock_input):
-    """Empty input is ignored and the loop continues (line 88)."""
-    calculator_repl()
-    mock_print.assert_any_call('Exiting')
-
-
-@patch('builtins.input', side_effect=['q'])
-@patch('builtins.print')
-@patch.object(Calculator, 'save_history', side_effect=Exception('disk full'))
-def test_repl_quit_save_error(mock_save, mock_print, mock_input):
-    """Exception during quit's save_history is swallowed (lines 97-98)."""
-    calculator_repl()
-    mock_print.assert_any_call('Exiting')
-
-
-@patch('builtins.input', side_effect=['=', 'q'])
-@patch('builtins.print')
-def test_repl_show_result_no_result(mock_print, mock_input):
-    """= with no prior result prints 'No result yet.' (line 114)."""
-    calculator_repl()
-    mock_print.assert_any_call('No result yet.')
-
-
-@patch('builtins.input', side_effect=['1 + 2', '=', 'q'])
-@patch('builtins.print')
-def test_repl_show_result(mock_print, mock_input):
-    """= with a result prints the formatted value (lines 115-116)."""
-    calculator_repl()
-    mock_print.assert_any_call('= 3')
-
-
-@patch('builtins.input', side_effect=['undo', 'q'])
-@patch('builtins.print')
-def test_repl_undo_nothing(mock_print, mock_input):
-    """undo with nothing to undo prints the appropriate message (line 129)."""
-    calculator_repl()
-    mock_print.assert_any_call('Nothing to undo.')
-
-
-@patch('builtins.input', side_effect=['1 + 2', 'undo', 'redo', 'q'])
-@patch('builtins.print')
-def test_repl_redo(mock_print, mock_input):
-    """Successful redo prints 'Redone.' (lines 133-137)."""
-    calculator_repl()
-    mock_print.assert_any_call('Redone.')
-
-
-@patch('builtins.input', side_effect=['redo', 'q'])
-@patch('builtins.print')
-def test_repl_redo_nothing(mock_print, mock_input):
-    """redo with nothing to redo prints the appropriate message (lines 138-139)."""
-    calculator_repl()
-    mock_print.assert_any_call('Nothing to redo.')
-
-
-@patch('builtins.input', side_effect=['save', 'q'])
-@patch('builtins.print')
-@patch.object(Calculator, 'save_history')
-def test_repl_save(mock_save, mock_print, mock_input):
-    """save command prints confirmation (lines 142-144)."""
-    calculator_repl()
-    mock_print.assert_any_call('History saved.')
-
-
-@patch('builtins.input', side_effect=['save', 'q'])
-@patch('builtins.print')
-@patch.object(Calculator, 'save_history', side_effect=[Exception('disk full'), None])
-def test_repl_save_error(mock_save, mock_print, mock_input):
-    """Exception during save prints an error message (lines 145-146)."""
-    calculator_repl()
-    printed = ' '.join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
-    assert 'Error saving history' in printed
-
-
-@patch('builtins.input', side_effect=['load', 'q'])
-@patch('builtins.print')
-@patch.object(Calculator, 'load_history')
-@patch.object(Calculator, 'show_history', return_value=[])
-def test_repl_load(mock_show, mock_load, mock_print, mock_input):
-    """load command calls load_history and prints confirmation (lines 150-154)."""
-    calculator_repl()
-    mock_load.assert_called()
-    mock_print.assert_any_call('History loaded.')
-
-
-@patch('builtins.input', side_effect=['load', 'q'])
-@patch('builtins.print')
-@patch.object(Calculator, 'save_history')
-@patch.object(Calculator, 'load_history', side_effect=Exception('file corrupted'))
-def test_repl_load_error(mock_load, mock_save, mock_print, mock_input):
-    """Exception during load prints an error message (lines 155-156)."""
-    calculator_repl()
-    printed = ' '.join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
-    assert 'Error loading history' in printed
-
-
-@patch('builtins.input', side_effect=['root -4 2', 'q'])
-@patch('builtins.print')
-def test_repl_root_error(mock_print, mock_input):
-    """ValidationError from a keyword operation prints an error (lines 168-169)."""
-    calculator_repl()
-    printed = ' '.join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
-    assert 'Error' in printed
-
-
-@patch('builtins.input', side_effect=['xyz abc', 'q'])
-@patch('builtins.print')
-def test_repl_invalid_input(mock_print, mock_input):
-    """Unrecognised input prints the help hint (lines 176-177)."""
-    calculator_repl()
-    mock_print.assert_any_call("Error: Unrecognised input. Type 'h' for help.")
-
-
-@patch('builtins.input', side_effect=['+ 3', 'q'])
-@patch('builtins.print')
-def test_repl_continuation_no_result(mock_print, mock_input):
-    """Continuation expression with no prior result prints an error (lines 187-189)."""
-    calculator_repl()
-    printed = ' '.join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
-    assert 'No previous result' in printed
-
-
-@patch('builtins.input', side_effect=['1 + 2', '+ 3', 'q'])
-@patch('builtins.print')
-def test_repl_continuation(mock_print, mock_input):
-    """Continuation expression uses the previous result (lines 190-192)."""
-    calculator_repl()
-    mock_print.assert_any_call('6')
-
-
-@patch('builtins.input', side_effect=['1 + 2', 'q'])
-@patch('builtins.print')
-@patch('app.calculator_repl.OperationFactory.create_operation',
-       side_effect=Exception('Unexpected'))
-def test_repl_unexpected_error(mock_op, mock_print, mock_input):
-    """Unhandled exceptions print 'Unexpected error: ...' (lines 200-201)."""
-    calculator_repl()
-    printed = ' '.join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
-    assert 'Unexpected error' in printed
+        assert '\nExiting' in capsys.readouterr().out
+
+    def test_repl_quit_save_error(self, monkeypatch, capsys):
+        """Exception during quit's save_history is swallowed (lines 97-98)."""
+        out = self._drive(monkeypatch, capsys, ('q',), patches=[
+            (Calculator, 'save_history', Mock(side_effect=Exception('disk full'))),
+        ])
+        assert 'Exiting' in out
+
+    def test_repl_show_result(self, monkeypatch, capsys, _noop_save):
+        """= with a result prints the formatted value (lines 115-116)."""
+        assert '= 3' in self._drive(monkeypatch, capsys, ('1 + 2', '=', 'q'))
+
+    def test_repl_redo(self, monkeypatch, capsys, _noop_save):
+        """Successful redo prints 'Redone.' (lines 133-137)."""
+        assert 'Redone.' in self._drive(monkeypatch, capsys,
+                                        ('1 + 2', 'undo', 'redo', 'q'))
+
+    def test_repl_save(self, monkeypatch, capsys):
+        """save command prints confirmation (lines 142-144)."""
+        out = self._drive(monkeypatch, capsys, _SAVE_Q, patches=[
+            (Calculator, 'save_history', Mock()),
+        ])
+        assert 'History saved.' in out
+
+    def test_repl_save_error(self, monkeypatch, capsys):
+        """Exception during save prints an error message (lines 145-146)."""
+        out = self._drive(monkeypatch, capsys, _SAVE_Q, patches=[
+            (Calculator, 'save_history',
+             Mock(side_effect=[Exception('disk full'), None])),
+        ])
+        assert 'Error saving history' in out
+
+    def test_repl_load(self, monkeypatch, capsys):
+        """load command calls load_history and prints confirmation (lines 150-154)."""
+        mock_load = Mock()
+        out = self._drive(monkeypatch, capsys, _LOAD_Q, patches=[
+            (Calculator, 'load_history', mock_load),
+            (Calculator, 'show_history', Mock(return_value=[])),
+        ])
+        mock_load.assert_called()
+        assert 'History loaded.' in out
+
+    def test_repl_load_error(self, monkeypatch, capsys):
+        """Exception during load prints an error message (lines 155-156)."""
+        out = self._drive(monkeypatch, capsys, _LOAD_Q, patches=[
+            (Calculator, 'save_history', Mock()),
+            (Calculator, 'load_history',
+             Mock(side_effect=Exception('file corrupted'))),
+        ])
+        assert 'Error loading history' in out
+
+    def test_repl_root_error(self, monkeypatch, capsys, _noop_save):
+        """ValidationError from a keyword operation prints an error (lines 168-169)."""
+        assert 'Error' in self._drive(monkeypatch, capsys, ('root -4 2', 'q'))
+
+    def test_repl_continuation(self, monkeypatch, capsys, _noop_save):
+        """Continuation expression uses the previous result (lines 190-192)."""
+        assert '\n6\n' in self._drive(monkeypatch, capsys, ('1 + 2', '+ 3', 'q'))
+
+    def test_repl_unexpected_error(self, monkeypatch, capsys):
+        """Unhandled exceptions print 'Unexpected error: ...' (lines 200-201)."""
+        out = self._drive(monkeypatch, capsys, _ADD_Q, patches=[
+            (Calculator, 'perform_operation',
+             Mock(side_effect=Exception('Unexpected'))),
+        ])
+        assert 'Unexpected error' in out
@@ -74,6 +74,17 @@ def test_invalid_max_input_value():
         config = CalculatorConfig(max_input_value=Decimal("-1"))
         config.validate()
 
+def test_invalid_history_format():
+    with pytest.raises(ConfigurationError, match="history_format must be"):
+        config = CalculatorConfig(history_format='xml')
+        config.validate()
+
+def test_invalid_auto_save_threshold():
+    # 0 would be swallowed by the `value or env-default` fallback, so use -1.
+    with pytest.raises(ConfigurationError, match="auto_save_threshold must be positive"):
+        config = CalculatorConfig(auto_save_threshold=-1)
+        config.validate()
+
 def test_auto_save_env_var_true():
     os.environ['CALCULATOR_AUTO_SAVE'] = 'true'
     config = CalculatorConfig(auto_save=None)
@@ -57,6 +57,22 @@ def test_autosave_observer_does_not_trigger_save_when_disabled():
     observer.update(calculation_mock)
     calculator_mock.save_history.assert_not_called()
 
+def test_autosave_observer_coalesces_below_threshold():
+    calculator_mock = Mock(spec=Calculator)
+    calculator_mock.config = Mock(spec=CalculatorConfig)
+    calculator_mock.config.auto_save = True
+    observer = AutoSaveObserver(calculator_mock, flush_threshold=3)
+
+    observer.update(calculation_mock)
+    observer.update(calculation_mock)
+    calculator_mock.save_history.assert_not_called()  # Still below the threshold
+
+    observer.update(calculation_mock)
+    calculator_mock.save_history.assert_called_once()  # Third update flushes
+
+    observer.update(calculation_mock)
+    calculator_mock.save_history.assert_called_once()  # Counter reset after flush
+
 # Additional negative test cases for AutoSaveObserver
 
 def test_autosave_observer_invalid_calculator():
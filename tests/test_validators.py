@@ -70,4 +70,48 @@ def test_validate_number_none_value():
 
 def test_validate_number_non_numeric_type():
     with pytest.raises(ValidationError, match="Invalid number format: "):
-        InputValidator.validate_number([], config)
\ No newline at end of file
+        InputValidator.validate_number([], config)
+
+# Test cases for InputValidator.validate_number_fast (float fast path)
+
+def test_validate_number_fast_string_decimal():
+    assert InputValidator.validate_number_fast("123.456", config) == 123.456
+
+def test_validate_number_fast_invalid_string():
+    with pytest.raises(ValidationError, match="Invalid number format: abc"):
+        InputValidator.validate_number_fast("abc", config)
+
+def test_validate_number_fast_exceeds_max_value():
+    with pytest.raises(ValidationError, match="Value exceeds maximum allowed"):
+        InputValidator.validate_number_fast("1000001", config)
+
+def test_validate_number_fast_none_value():
+    with pytest.raises(ValidationError, match="Invalid number format: None"):
+        InputValidator.validate_number_fast(None, config)
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf"])
+def test_validate_number_fast_non_finite(value):
+    with pytest.raises(ValidationError, match="Invalid number format"):
+        InputValidator.validate_number_fast(value, config)
+
+# Test cases for InputValidator.validate_expression (hand-written scanner)
+
+def test_validate_expression_full_expression():
+    parsed = InputValidator.validate_expression("2.5 + 0.5")
+    assert parsed == ('2.5', '+', '0.5')
+
+def test_validate_expression_continuation():
+    parsed = InputValidator.validate_expression("- 2.5")
+    assert parsed == (None, '-', '2.5')
+
+def test_validate_expression_signed_operands():
+    # Whitespace between a sign and its digits is dropped from the token
+    parsed = InputValidator.validate_expression("-1*- 2")
+    assert parsed == ('-1', '*', '-2')
+
+def test_validate_expression_trailing_dot_rejected():
+    # A dot with no digits after it is not part of an operand
+    assert InputValidator.validate_expression("5. + 1") is None
+
+def test_validate_expression_extra_terms_rejected():
+    assert InputValidator.validate_expression("1 + 2 + 3") is None